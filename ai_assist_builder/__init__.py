@@ -20,6 +20,7 @@ from markupsafe import escape
 
 from ai_assist_builder.models.api_map import map_api_response_to_internal
 from ai_assist_builder.models.question import Question
+from ai_assist_builder.utils.api_client import BackendClient
 from ai_assist_builder.utils.classification_utils import (
     filter_classification_responses,
     get_classification,
@@ -65,7 +66,6 @@ SESSION_LIMIT = 10700
 DEBUG = True
 TOKEN_EXPIRY = 3600  # 1 hour
 REFRESH_THRESHOLD = 300  # 5 minutes
-API_TIMER_SEC = 30
 FOLLOW_UP_TYPE = "both"  # closed or open or both
 SURVEY_NAME = "TLFS PoC"
 DEFAULT_ENDPOINT = "classify"  # classify (one prompt) or classify-v3 (two prompts: reranker and unabmiguous)
@@ -92,6 +92,10 @@ jwt_token = generate_jwt(
 # Print the last 5 digits of the jwt token
 print(f"JWT Token ends with {jwt_token[-5:]} created at {token_start_time}")
 
+# Shared pooled client for the Survey Assist API, the token is read on each
+# request so refreshes in before_request are picked up
+backend_client = BackendClient(backend_api_url, token_provider=lambda: jwt_token)
+
 # Load the questions from the JSON file
 with open("ai_assist_builder/content/condensed_tlfs_sic_soc.json") as file:
     survey_data = json.load(file)
@@ -323,11 +327,11 @@ def config():  # noqa: PLR0911
         applied = False
 
     # Get the config from the backend
-    api_url = backend_api_url + "/survey-assist/config"
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    api_path = "/survey-assist/config"
+    api_url = backend_client.url(api_path)
     log_api_send(logger, api_url, None)
     try:
-        response = requests.get(api_url, headers=headers, timeout=API_TIMER_SEC)
+        response = backend_client.get(api_path)
         response_data = response.json()
 
         log_api_rcv(logger, api_url, response_data)
@@ -539,14 +543,12 @@ def chat_lookup():  # noqa: PLR0911
     chat_response = request.json
     org_description = chat_response.get("org_description")
 
-    api_url = (
-        backend_api_url
-        + f"/survey-assist/sic-lookup?description={org_description}&similarity=true"
-    )
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    api_path = "/survey-assist/sic-lookup"
+    params = {"description": org_description, "similarity": "true"}
+    api_url = backend_client.url(api_path, params)
     log_api_send(logger, api_url, None)
     try:
-        response = requests.get(api_url, headers=headers, timeout=API_TIMER_SEC)
+        response = backend_client.get(api_path, params=params)
         response_data = response.json()
 
         log_api_rcv(logger, api_url, response_data)
@@ -595,7 +597,8 @@ def chat_assist():  # noqa: PLR0911
     # Find the question about job_title
     user_response = request.json
 
-    api_url = backend_api_url + f"/survey-assist/{session["endpoint"]}"
+    api_path = f"/survey-assist/{session["endpoint"]}"
+    api_url = backend_client.url(api_path)
 
     body = {
         "llm": llm,
@@ -604,14 +607,11 @@ def chat_assist():  # noqa: PLR0911
         "job_description": user_response.get("job_description"),
         "org_description": user_response.get("org_description"),
     }
-    headers = {"Authorization": f"Bearer {jwt_token}"}
 
     log_api_send(logger, api_url, body)
     try:
         # Send a request to the Survey Assist API
-        response = requests.post(
-            api_url, json=body, headers=headers, timeout=API_TIMER_SEC
-        )
+        response = backend_client.post(api_path, json=body)
         response.raise_for_status()  # Raise an error for HTTP codes 4xx/5xx
         response_data = response.json()
         log_api_rcv(logger, api_url, response_data)
@@ -672,7 +672,8 @@ def survey_assist():  # noqa: C901, PLR0911
     # Find the question about job_title
     user_response = session.get("response")
 
-    api_url = backend_api_url + f"/survey-assist/{session["endpoint"]}"
+    api_path = f"/survey-assist/{session["endpoint"]}"
+    api_url = backend_client.url(api_path)
 
     body = {
         "llm": llm,
@@ -681,14 +682,11 @@ def survey_assist():  # noqa: C901, PLR0911
         "job_description": user_response.get("job_description"),
         "org_description": user_response.get("organisation_activity"),
     }
-    headers = {"Authorization": f"Bearer {jwt_token}"}
     log_api_send(logger, api_url, body)
 
     try:
         # Send a request to the Survey Assist API
-        response = requests.post(
-            api_url, json=body, headers=headers, timeout=API_TIMER_SEC
-        )
+        response = backend_client.post(api_path, json=body)
         response_data = response.json()
         log_api_rcv(logger, api_url, response_data)
 
@@ -1110,9 +1108,8 @@ def survey_assist_results():  # noqa: C901, PLR0912, PLR0915
         # Get the updated classification using the answers
         # to the follow up questions from the first interaction with Survey Assist
         updated_classification = get_classification(
-            backend_api_url,
+            backend_client,
             session["endpoint"],
-            jwt_token,
             "gemini",
             "sic",
             filtered_responses,
@@ -1252,7 +1249,8 @@ def save_results():  # noqa: PLR0911, PLR0915, C901
     print(sa_response_list)
     print("==========================")
 
-    api_url = backend_api_url + "/survey-assist/response"
+    api_path = "/survey-assist/response"
+    api_url = backend_client.url(api_path)
 
     body = {
         "user_id": user,
@@ -1279,15 +1277,11 @@ def save_results():  # noqa: PLR0911, PLR0915, C901
         ],
     }
 
-    headers = {"Authorization": f"Bearer {jwt_token}"}
-
     log_api_send(logger, api_url, body)
     # make an api request
     try:
         # Send a request to the Survey Assist API
-        response = requests.post(
-            api_url, json=body, headers=headers, timeout=API_TIMER_SEC
-        )
+        response = backend_client.post(api_path, json=body)
         log_api_rcv(logger, api_url, response.json())
 
         if response.status_code != HTTPStatus.OK or not response.json():
@@ -1731,14 +1725,12 @@ def followup_redirect():
 @log_entry(logger)
 def sic_lookup(request, value):  # noqa: PLR0911
     # Send Get Request to the API
-    api_url = (
-        backend_api_url
-        + f"/survey-assist/sic-lookup?description={request.form.get(value)}&similarity=true"
-    )
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    api_path = "/survey-assist/sic-lookup"
+    params = {"description": request.form.get(value), "similarity": "true"}
+    api_url = backend_client.url(api_path, params)
     log_api_send(logger, api_url, None)
     try:
-        response = requests.get(api_url, headers=headers, timeout=API_TIMER_SEC)
+        response = backend_client.get(api_path, params=params)
         response_data = response.json()
         log_api_rcv(logger, api_url, response_data)
         return response_data
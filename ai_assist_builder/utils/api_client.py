@@ -0,0 +1,194 @@
+"""Shared HTTP client for the Survey Assist backend API.
+
+All calls to the backend go through a single BackendClient so that
+connections to the API gateway are pooled and kept alive between requests,
+rather than paying a fresh TCP and TLS handshake on every survey step.
+
+Typical usage:
+
+    ```
+    client = BackendClient(backend_api_url, token_provider=lambda: jwt_token)
+    response = client.post("/survey-assist/classify", json=body)
+    ```
+"""
+
+import os
+import time
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+# Connection pool sizing, the pool should be at least as large as the
+# number of worker threads that can call the backend at the same time.
+# BACKEND_POOL_MAXSIZE is only the default, callers that know their
+# concurrency should pass pool_maxsize to BackendClient explicitly.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = int(os.getenv("BACKEND_POOL_MAXSIZE", "20"))
+
+# Pooled connections idle for longer than this are closed and reopened
+# rather than reused. This must be below the API gateway's keep-alive idle
+# timeout, otherwise a POST can be written to a socket the gateway has
+# already closed, which urllib3 reports as a read error and will not retry.
+POOL_IDLE_TIMEOUT_SEC = 30
+
+# Retry budget - connect errors are retried for any method as the request
+# never reached the backend. Read errors and gateway errors are only retried
+# for GET so that a classification (LLM call) is never sent twice.
+RETRY_TOTAL = 2
+RETRY_BACKOFF_SEC = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+
+CONNECT_TIMEOUT_SEC = 3.05
+DEFAULT_READ_TIMEOUT_SEC = 30
+
+# Read timeouts per backend endpoint (last path segment)
+ENDPOINT_TIMEOUTS = {
+    "config": 10,
+    "sic-lookup": 10,
+    "classify": 30,
+    "classify-v3": 30,
+    "response": 30,
+}
+
+
+class _IdleLimitedPoolMixin:
+    """Close pooled connections that have been idle too long before reuse."""
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        last_used = getattr(conn, "last_used", None)
+        if (
+            last_used is not None
+            and time.monotonic() - last_used > POOL_IDLE_TIMEOUT_SEC
+        ):
+            # The connection reopens on the next request
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.last_used = time.monotonic()
+        super()._put_conn(conn)
+
+
+class _IdleLimitedHTTPConnectionPool(_IdleLimitedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _IdleLimitedHTTPSConnectionPool(_IdleLimitedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _IdleLimitedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _IdleLimitedHTTPConnectionPool,
+            "https": _IdleLimitedHTTPSConnectionPool,
+        }
+
+
+class BackendClient:
+    """Pooled, keep-alive client for the Survey Assist API.
+
+    Args:
+        base_url (str): The base URL of the Survey Assist API.
+        token_provider (callable): Returns the current JWT, called on every
+            request so that refreshed tokens are picked up.
+        timeouts (dict): Optional read timeout overrides keyed by endpoint.
+        pool_maxsize (int): Maximum number of pooled connections per host.
+        retries (int): Maximum number of retries for a single request.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        token_provider,
+        timeouts=None,
+        pool_maxsize=POOL_MAXSIZE,
+        retries=RETRY_TOTAL,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._token_provider = token_provider
+        self.timeouts = {**ENDPOINT_TIMEOUTS, **(timeouts or {})}
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            backoff_factor=RETRY_BACKOFF_SEC,
+            raise_on_status=False,
+        )
+        adapter = _IdleLimitedAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path, params=None):
+        """Build the full URL for a backend path, used for logging."""
+        url = self.base_url + path
+        if params:
+            url += "?" + urlencode(params)
+        return url
+
+    def headers(self):
+        """Headers sent with every backend request."""
+        return {"Authorization": f"Bearer {self._token_provider()}"}
+
+    def timeout(self, path, read_timeout=None):
+        """Return the (connect, read) timeout for a backend path."""
+        if read_timeout is None:
+            endpoint = path.rstrip("/").split("/")[-1]
+            read_timeout = self.timeouts.get(endpoint, DEFAULT_READ_TIMEOUT_SEC)
+        return (CONNECT_TIMEOUT_SEC, read_timeout)
+
+    def get(self, path, params=None, read_timeout=None):
+        """Send a GET request to the backend.
+
+        Args:
+            path (str): The API path, e.g. "/survey-assist/config".
+            params (dict): Optional query string parameters.
+            read_timeout (float): Overrides the endpoint's read timeout.
+
+        Returns:
+            requests.Response: The response from the backend.
+        """
+        return self.session.get(
+            self.base_url + path,
+            params=params,
+            headers=self.headers(),
+            timeout=self.timeout(path, read_timeout),
+        )
+
+    def post(self, path, json=None, read_timeout=None):
+        """Send a POST request with a JSON body to the backend.
+
+        Args:
+            path (str): The API path, e.g. "/survey-assist/classify".
+            json (dict): The request body.
+            read_timeout (float): Overrides the endpoint's read timeout.
+
+        Returns:
+            requests.Response: The response from the backend.
+        """
+        return self.session.post(
+            self.base_url + path,
+            json=json,
+            headers=self.headers(),
+            timeout=self.timeout(path, read_timeout),
+        )
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
@@ -7,7 +7,8 @@ from google.cloud import storage
 
 from ai_assist_builder.utils.debug_utils import log_api_rcv, log_api_send
 
-# TODO - move this to central config
+# Read timeout for the final re-classification, kept shorter than the initial
+# classify call as the user is waiting on the results page
 API_TIMER_SEC = 15
 
 
@@ -59,14 +60,13 @@ def filter_classification_responses(survey_data, classified_questions):
 
 
 def get_classification(  # noqa: PLR0913
-    backend_api_url, endpoint, jwt_token, llm, type, input_data, logger
+    backend_client, endpoint, llm, type, input_data, logger
 ):
     """Send a request to the Survey Assist API to classify the input data.
 
     Args:
-        backend_api_url (str): The URL of the Survey Assist API.
+        backend_client (BackendClient): The shared Survey Assist API client.
         endpoint (str): The endpoint to send the request to.
-        jwt_token (str): The JWT token for authentication.
         llm (str): The LLM code for the classification.
         type (str): The type of classification (e.g., "sic").
         input_data (list): A list of dictionaries containing the input data.
@@ -75,7 +75,8 @@ def get_classification(  # noqa: PLR0913
     Returns:
         response_data (dict): The response data from the API.
     """
-    api_url = backend_api_url + f"/survey-assist/{endpoint}"
+    api_path = f"/survey-assist/{endpoint}"
+    api_url = backend_client.url(api_path)
     print("SENDING REQUEST API URL:", api_url)
     body = {
         "llm": llm,
@@ -85,14 +86,11 @@ def get_classification(  # noqa: PLR0913
         "org_description": input_data[2]["response"],
     }
 
-    headers = {"Authorization": f"Bearer {jwt_token}"}
     log_api_send(logger, api_url, body)
 
     try:
         # Send a request to the Survey Assist API
-        response = requests.post(
-            api_url, json=body, headers=headers, timeout=API_TIMER_SEC
-        )
+        response = backend_client.post(api_path, json=body, read_timeout=API_TIMER_SEC)
         response_data = response.json()
 
         log_api_rcv(logger, api_url, response_data)
@@ -0,0 +1,25 @@
+# Gunicorn configuration for serving the UI.
+#
+# WORKER_CLASS selects the execution mode:
+#   sync   - one request per worker, a slow classification blocks the worker
+#   gevent - cooperative workers, blocking socket I/O (including the pooled
+#            backend client) yields to other requests, so one worker keeps
+#            up to WORKER_CONNECTIONS backend calls in flight at once
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = os.getenv("WORKER_CLASS", "gevent")
+workers = int(os.getenv("WORKERS", "2"))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "100"))
+
+# Must exceed the longest backend read timeout (see utils/api_client.py)
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+# Size the backend connection pool to the number of concurrent requests
+# a worker can serve, otherwise connections are opened and discarded
+os.environ.setdefault(
+    "BACKEND_POOL_MAXSIZE",
+    str(worker_connections if worker_class == "gevent" else 10),
+)
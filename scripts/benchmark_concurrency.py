@@ -0,0 +1,91 @@
+# Measures how many backend-bound requests a single UI worker keeps in flight.
+#
+# Start the stub backend with a classification delay, start the UI with one
+# worker (sync or gevent), then run this script against it:
+#
+#     python scripts/stub_backend.py --port 5000 --classify-delay 2.0
+#     BACKEND_API_URL=http://127.0.0.1:5000 WORKERS=1 make run-ui-sync
+#     python scripts/benchmark_concurrency.py --journeys 40 --concurrency 20
+#
+# The session cookie is signed locally with FLASK_SECRET_KEY, which must match
+# the value the UI was started with.
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from flask import Flask
+from flask.sessions import SecureCookieSessionInterface
+
+JOURNEY_INPUT = {
+    "job_title": "Checkout operator",
+    "job_description": "I scan shopping, take cash and handle customer queries",
+    "org_description": "We sell food and household goods",
+}
+
+
+def signed_session_cookie(secret_key):
+    """Create a session cookie equivalent to a logged in tester."""
+    app = Flask(__name__)
+    app.secret_key = secret_key
+    serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+    return serializer.dumps(
+        {
+            "user": "benchmark.user@ons.gov.uk",
+            "role": "tester",
+            "endpoint": "classify",
+            "follow_up_type": "both",
+        }
+    )
+
+
+def run_journey(url, cookie):
+    """Send one chat_assist request and return the latency in seconds."""
+    start = time.perf_counter()
+    response = requests.post(
+        f"{url}/chat_assist",
+        json=JOURNEY_INPUT,
+        cookies={"session": cookie},
+        timeout=120,
+    )
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent journeys")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--journeys", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--backend-delay",
+        type=float,
+        default=2.0,
+        help="Classification delay the stub backend was started with",
+    )
+    args = parser.parse_args()
+
+    cookie = signed_session_cookie(os.environ["FLASK_SECRET_KEY"])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        latencies = list(
+            executor.map(lambda _: run_journey(args.url, cookie), range(args.journeys))
+        )
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(f"Journeys: {args.journeys} at concurrency {args.concurrency}")
+    print(f"Elapsed: {elapsed:.2f}s  Throughput: {args.journeys / elapsed:.2f}/s")
+    print(f"Latency p50: {statistics.median(latencies):.2f}s  p95: {p95:.2f}s")
+    # Little's law - journeys completed per second multiplied by the time each
+    # one spends waiting on the backend gives the number served concurrently
+    in_flight = args.journeys / elapsed * args.backend_delay
+    print(f"Concurrent journeys per worker: {in_flight:.1f}")
+
+
+if __name__ == "__main__":
+    main()
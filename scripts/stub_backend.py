@@ -0,0 +1,158 @@
+# Local stub of the Survey Assist API used for benchmarking and offline testing.
+# Serves canned classify, sic-lookup, config and response payloads with an
+# optional artificial delay on classification to mimic LLM latency.
+#
+# Usage:
+#     python scripts/stub_backend.py --port 5000 --classify-delay 2.0
+#     BACKEND_API_URL=http://127.0.0.1:5000 make run-ui
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Organisation descriptions the stub treats as a direct SIC lookup match
+KNOWN_LOOKUPS = {
+    "football club": {
+        "code": "93120",
+        "code_meta": {"title": "Activities of sport clubs", "detail": ""},
+        "code_division_meta": {"code": "93", "title": "Sports activities"},
+    },
+    "supermarket": {
+        "code": "47110",
+        "code_meta": {
+            "title": "Retail sale in non-specialised stores with food, beverages or tobacco predominating",
+            "detail": "",
+        },
+        "code_division_meta": {"code": "47", "title": "Retail trade"},
+    },
+}
+
+SIC_CANDIDATES = [
+    {
+        "sic_code": "47110",
+        "sic_descriptive": "Retail sale in non-specialised stores with food, beverages or tobacco predominating",
+        "likelihood": 0.8,
+    },
+    {
+        "sic_code": "47190",
+        "sic_descriptive": "Other retail sale in non-specialised stores",
+        "likelihood": 0.5,
+    },
+    {
+        "sic_code": "47290",
+        "sic_descriptive": "Other retail sale of food in specialised stores",
+        "likelihood": 0.3,
+    },
+]
+
+PROMPTS = {"classification": [{"prompts": [{"text": "Stub prompt"}] * 2}]}
+
+request_counts = {}
+counts_lock = threading.Lock()
+
+
+def classify_response(body):
+    """Build an uncoded classify response with follow-up questions."""
+    org_description = body.get("org_description") or ""
+    return {
+        "classified": False,
+        "followup": "Does your organisation mainly sell food or other goods?",
+        "sic_code": SIC_CANDIDATES[0]["sic_code"],
+        "sic_description": SIC_CANDIDATES[0]["sic_descriptive"],
+        "sic_candidates": SIC_CANDIDATES,
+        "reasoning": f"Stub classification for '{org_description}'",
+    }
+
+
+def lookup_response(description):
+    """Build a sic-lookup response for a description."""
+    match = KNOWN_LOOKUPS.get((description or "").strip().lower())
+    if match:
+        return {"description": description, **match}
+
+    return {
+        "description": description,
+        "code": None,
+        "potential_matches": {
+            "codes": [c["sic_code"] for c in SIC_CANDIDATES],
+            "descriptions": [c["sic_descriptive"] for c in SIC_CANDIDATES],
+            "codes_count": len(SIC_CANDIDATES),
+            "divisions": [{"code": "47", "meta": {"title": "Retail trade"}}],
+            "divisions_count": 1,
+        },
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Artificial latency in seconds, set from the command line
+    classify_delay = 0.0
+    lookup_delay = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, data, status=200):
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def count(self, path):
+        with counts_lock:
+            request_counts[path] = request_counts.get(path, 0) + 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.count(url.path)
+
+        if url.path == "/survey-assist/sic-lookup":
+            time.sleep(self.lookup_delay)
+            description = parse_qs(url.query).get("description", [""])[0]
+            self.send_json(lookup_response(description))
+        elif url.path == "/survey-assist/config":
+            self.send_json({"llm_model": "stub", "v1v2": PROMPTS, "v3": PROMPTS})
+        elif url.path == "/stub/counts":
+            with counts_lock:
+                self.send_json(dict(request_counts))
+        else:
+            self.send_json({"error": "Not found"}, status=404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        self.count(url.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if url.path in ("/survey-assist/classify", "/survey-assist/classify-v3"):
+            time.sleep(self.classify_delay)
+            self.send_json(classify_response(body))
+        elif url.path == "/survey-assist/response":
+            self.send_json({"message": "Stub response stored"})
+        else:
+            self.send_json({"error": "Not found"}, status=404)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a stub Survey Assist API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--classify-delay", type=float, default=0.0)
+    parser.add_argument("--lookup-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    StubHandler.classify_delay = args.classify_delay
+    StubHandler.lookup_delay = args.lookup_delay
+
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    print(f"Stub Survey Assist API listening on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()